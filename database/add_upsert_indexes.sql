@@ -0,0 +1,66 @@
+-- Add the unique indexes the scraper's bulk upserts rely on
+-- store_race_results resolves athletes and venues and skips already-stored results
+-- with INSERT ... ON CONFLICT, which needs a unique index on the columns that identify a row
+
+BEGIN;
+
+-- Older databases were created before the school column was added to init.sql
+ALTER TABLE athletes ADD COLUMN IF NOT EXISTS school VARCHAR(200);
+
+-- Earlier scraper versions inserted athletes and venues without a uniqueness check,
+-- so merge any duplicates before the unique indexes are built: keep the oldest row
+-- of each group and point the rows that reference the others at it.
+-- Rows with a NULL school never conflict under the index, so they are left alone
+CREATE TEMP TABLE athlete_merge ON COMMIT DROP AS
+SELECT id AS duplicate_id, keep_id
+FROM (
+    SELECT id,
+           first_value(id) OVER (PARTITION BY first_name, last_name, gender, school
+                                 ORDER BY created_at, id) AS keep_id
+    FROM athletes
+    WHERE school IS NOT NULL
+) ranked
+WHERE id <> keep_id;
+
+UPDATE results r SET athlete_id = m.keep_id
+FROM athlete_merge m
+WHERE r.athlete_id = m.duplicate_id;
+
+DELETE FROM athletes a USING athlete_merge m WHERE a.id = m.duplicate_id;
+
+CREATE TEMP TABLE venue_merge ON COMMIT DROP AS
+SELECT id AS duplicate_id, keep_id
+FROM (
+    SELECT id,
+           first_value(id) OVER (PARTITION BY name ORDER BY created_at, id) AS keep_id
+    FROM venues
+) ranked
+WHERE id <> keep_id;
+
+UPDATE meets mt SET venue_id = m.keep_id
+FROM venue_merge m
+WHERE mt.venue_id = m.duplicate_id;
+
+DELETE FROM venues v USING venue_merge m WHERE v.id = m.duplicate_id;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_athletes_identity ON athletes(first_name, last_name, gender, school);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_venues_name ON venues(name);
+-- The baseline stored every row of a new race without a duplicate check, and the
+-- athlete merge above can leave one athlete with two rows for the same race and
+-- place. Keep the earliest stored row of each (race_id, athlete_id, place).
+-- Rows with a NULL key column never conflict under the index, so they are left alone
+DELETE FROM results r
+USING (
+    SELECT id,
+           row_number() OVER (PARTITION BY race_id, athlete_id, place
+                              ORDER BY created_at, id) AS copy_number
+    FROM results
+    WHERE race_id IS NOT NULL AND athlete_id IS NOT NULL AND place IS NOT NULL
+) ranked
+WHERE r.id = ranked.id AND ranked.copy_number > 1;
+
+-- Re-scraping a race only adds rows for new (race, athlete, place) keys: a stored
+-- result is kept as-is even if the page now shows a corrected time
+CREATE UNIQUE INDEX IF NOT EXISTS idx_results_identity ON results(race_id, athlete_id, place);
+
+COMMIT;
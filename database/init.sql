@@ -24,6 +24,7 @@ CREATE TABLE athletes (
     first_name VARCHAR(100) NOT NULL,
     last_name VARCHAR(100) NOT NULL,
     gender VARCHAR(10) NOT NULL CHECK (gender IN ('male', 'female')),
+    school VARCHAR(200),
     graduation_year INTEGER,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
@@ -74,11 +75,14 @@ CREATE TABLE results (
 -- Indexes for better performance
 CREATE INDEX idx_athletes_name ON athletes(last_name, first_name);
 CREATE INDEX idx_athletes_gender ON athletes(gender);
+CREATE UNIQUE INDEX idx_athletes_identity ON athletes(first_name, last_name, gender, school);
+CREATE UNIQUE INDEX idx_venues_name ON venues(name);
 CREATE INDEX idx_meets_date ON meets(meet_date);
 CREATE INDEX idx_meets_season ON meets(season);
 CREATE INDEX idx_races_meet ON races(meet_id);
 CREATE INDEX idx_races_class_gender ON races(race_class, gender);
 CREATE INDEX idx_results_race ON results(race_id);
+CREATE UNIQUE INDEX idx_results_identity ON results(race_id, athlete_id, place);
 CREATE INDEX idx_results_athlete ON results(athlete_id);
 CREATE INDEX idx_results_time ON results(time_seconds);
 
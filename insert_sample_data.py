@@ -4,11 +4,24 @@ Sample data insertion script for Cross Country Statistics Tracker
 This script adds some sample data to test the system functionality.
 """
 
+import csv
+import io
 import os
 import sys
+import uuid
 from sqlalchemy import create_engine, text
 from datetime import datetime
 
+ATHLETES_COPY_SQL = "COPY athletes (id, first_name, last_name, gender, graduation_year) FROM STDIN WITH (FORMAT csv)"
+RESULTS_COPY_SQL = "COPY results (race_id, athlete_id, time_seconds, place, varsity_points) FROM STDIN WITH (FORMAT csv)"
+
+def copy_rows(cursor, copy_sql, rows):
+    """Stream rows to the server in a single COPY ... FROM STDIN round-trip."""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    buffer.seek(0)
+    cursor.copy_expert(copy_sql, buffer)
+
 def insert_sample_data():
     """Insert sample cross country data for testing."""
     
@@ -16,171 +29,115 @@ def insert_sample_data():
     engine = create_engine(database_url)
     
     try:
-        with engine.connect() as conn:
+        with engine.begin() as conn:
             print("Inserting sample data...")
+
+            # engine.begin() runs the whole load as one transaction; don't wait on
+            # the WAL flush when it commits
+            conn.execute(text("SET LOCAL synchronous_commit = off"))
+
+            # Generate every id client-side so nothing has to be read back from
+            # the server before the dependent rows can be written
+            venue_id = str(uuid.uuid4())
+            meet_id = str(uuid.uuid4())
+            race_id = str(uuid.uuid4())
+            girls_race_id = str(uuid.uuid4())
             
-            # Insert sample venue
-            venue_result = conn.execute(
-                text("INSERT INTO venues (name, location, state) VALUES (:name, :location, :state) RETURNING id"),
-                {"name": "Spring Canyon Park", "location": "Fort Collins", "state": "CO"}
-            )
-            venue_id = str(venue_result.fetchone()[0])
-            print(f"Created venue: {venue_id}")
-            
-            # Insert sample meet
-            meet_result = conn.execute(
+            # Insert the sample venue, meet and races (Boys and Girls Varsity 5K)
+            # in one statement
+            conn.execute(
                 text("""
-                    INSERT INTO meets (name, meet_date, venue_id, season, milesplit_url)
-                    VALUES (:name, :meet_date, :venue_id, :season, :url)
-                    RETURNING id
+                    WITH venue AS (
+                        INSERT INTO venues (id, name, location, state)
+                        VALUES (:venue_id, :venue_name, :location, :state)
+                    ), meet AS (
+                        INSERT INTO meets (id, name, meet_date, venue_id, season, milesplit_url)
+                        VALUES (:meet_id, :meet_name, :meet_date, :venue_id, :season, :url)
+                    )
+                    INSERT INTO races (id, meet_id, distance, race_class, gender)
+                    VALUES (:race_id, :meet_id, :distance, :race_class, 'male'),
+                           (:girls_race_id, :meet_id, :distance, :race_class, 'female')
                 """),
                 {
-                    "name": "Sample Cross Country Meet 2024",
-                    "meet_date": "2024-09-15",
                     "venue_id": venue_id,
-                    "season": "2024",
-                    "url": "https://co.milesplit.com/meets/sample"
-                }
-            )
-            meet_id = str(meet_result.fetchone()[0])
-            print(f"Created meet: {meet_id}")
-            
-            # Insert sample race (Boys Varsity 5K)
-            race_result = conn.execute(
-                text("""
-                    INSERT INTO races (meet_id, distance, race_class, gender)
-                    VALUES (:meet_id, :distance, :race_class, :gender)
-                    RETURNING id
-                """),
-                {
+                    "venue_name": "Spring Canyon Park",
+                    "location": "Fort Collins",
+                    "state": "CO",
                     "meet_id": meet_id,
+                    "meet_name": "Sample Cross Country Meet 2024",
+                    "meet_date": "2024-09-15",
+                    "season": "2024",
+                    "url": "https://co.milesplit.com/meets/sample",
+                    "race_id": race_id,
+                    "girls_race_id": girls_race_id,
                     "distance": "5K",
-                    "race_class": "varsity",
-                    "gender": "male"
+                    "race_class": "varsity"
                 }
             )
-            race_id = str(race_result.fetchone()[0])
-            print(f"Created race: {race_id}")
+            added_lines = [
+                f"Created venue: {venue_id}",
+                f"Created meet: {meet_id}",
+                f"Created races: {race_id}, {girls_race_id}",
+            ]
             
             # Sample athletes and results
             sample_results = [
-                ("John", "Smith", 16, 45, 1, 7),  # 16:45, 1st place, 7 points
-                ("Mike", "Johnson", 16, 52, 2, 6),  # 16:52, 2nd place, 6 points
-                ("David", "Wilson", 17, 8, 3, 5),   # 17:08, 3rd place, 5 points
-                ("Chris", "Brown", 17, 15, 4, 4),   # 17:15, 4th place, 4 points
-                ("Ryan", "Davis", 17, 22, 5, 3),    # 17:22, 5th place, 3 points
-                ("Alex", "Miller", 17, 30, 6, 2),   # 17:30, 6th place, 2 points
-                ("Tyler", "Garcia", 17, 35, 7, 1),  # 17:35, 7th place, 1 point
-                ("Jake", "Martinez", 17, 42, 8, 0), # 17:42, 8th place, 0 points
-                ("Sam", "Anderson", 17, 48, 9, 0),  # 17:48, 9th place, 0 points
-                ("Ben", "Taylor", 17, 55, 10, 0),   # 17:55, 10th place, 0 points
+                ("John", "Smith", 16 * 60 + 45, 1, 7),  # 16:45, 1st place, 7 points
+                ("Mike", "Johnson", 16 * 60 + 52, 2, 6),  # 16:52, 2nd place, 6 points
+                ("David", "Wilson", 17 * 60 + 8, 3, 5),   # 17:08, 3rd place, 5 points
+                ("Chris", "Brown", 17 * 60 + 15, 4, 4),   # 17:15, 4th place, 4 points
+                ("Ryan", "Davis", 17 * 60 + 22, 5, 3),    # 17:22, 5th place, 3 points
+                ("Alex", "Miller", 17 * 60 + 30, 6, 2),   # 17:30, 6th place, 2 points
+                ("Tyler", "Garcia", 17 * 60 + 35, 7, 1),  # 17:35, 7th place, 1 point
+                ("Jake", "Martinez", 17 * 60 + 42, 8, 0), # 17:42, 8th place, 0 points
+                ("Sam", "Anderson", 17 * 60 + 48, 9, 0),  # 17:48, 9th place, 0 points
+                ("Ben", "Taylor", 17 * 60 + 55, 10, 0),   # 17:55, 10th place, 0 points
             ]
             
-            for first_name, last_name, minutes, seconds, place, points in sample_results:
-                # Create athlete
-                athlete_result = conn.execute(
-                    text("""
-                        INSERT INTO athletes (first_name, last_name, gender, graduation_year)
-                        VALUES (:first_name, :last_name, :gender, :grad_year)
-                        RETURNING id
-                    """),
-                    {
-                        "first_name": first_name,
-                        "last_name": last_name,
-                        "gender": "male",
-                        "grad_year": 2025
-                    }
-                )
-                athlete_id = str(athlete_result.fetchone()[0])
-                
-                # Calculate total seconds
-                time_seconds = minutes * 60 + seconds
+            athlete_rows = []
+            result_rows = []
+            
+            for first_name, last_name, time_seconds, place, points in sample_results:
+                athlete_id = uuid.uuid4()
+                athlete_rows.append((athlete_id, first_name, last_name, "male", 2025))
                 
-                # Create result
-                conn.execute(
-                    text("""
-                        INSERT INTO results (race_id, athlete_id, time_seconds, place, varsity_points)
-                        VALUES (:race_id, :athlete_id, :time_seconds, :place, :points)
-                    """),
-                    {
-                        "race_id": race_id,
-                        "athlete_id": athlete_id,
-                        "time_seconds": time_seconds,
-                        "place": place,
-                        "points": points
-                    }
-                )
+                result_rows.append((race_id, athlete_id, time_seconds, place, points))
                 
-                print(f"Added athlete: {first_name} {last_name} - {minutes}:{seconds:02d} (Place: {place})")
-            
-            # Add a sample girls race too
-            girls_race_result = conn.execute(
-                text("""
-                    INSERT INTO races (meet_id, distance, race_class, gender)
-                    VALUES (:meet_id, :distance, :race_class, :gender)
-                    RETURNING id
-                """),
-                {
-                    "meet_id": meet_id,
-                    "distance": "5K",
-                    "race_class": "varsity",
-                    "gender": "female"
-                }
-            )
-            girls_race_id = str(girls_race_result.fetchone()[0])
+                added_lines.append(f"Added athlete: {first_name} {last_name} - {time_seconds // 60}:{time_seconds % 60:02d} (Place: {place})")
             
             # Sample girls results
             girls_results = [
-                ("Sarah", "Johnson", 19, 15, 1, 7),  # 19:15, 1st place
-                ("Emily", "Davis", 19, 28, 2, 6),    # 19:28, 2nd place
-                ("Ashley", "Wilson", 19, 35, 3, 5),  # 19:35, 3rd place
-                ("Jessica", "Brown", 19, 42, 4, 4),  # 19:42, 4th place
-                ("Amanda", "Miller", 19, 50, 5, 3),  # 19:50, 5th place
-                ("Rachel", "Garcia", 19, 58, 6, 2),  # 19:58, 6th place
-                ("Lauren", "Martinez", 20, 5, 7, 1), # 20:05, 7th place
+                ("Sarah", "Johnson", 19 * 60 + 15, 1, 7),  # 19:15, 1st place
+                ("Emily", "Davis", 19 * 60 + 28, 2, 6),    # 19:28, 2nd place
+                ("Ashley", "Wilson", 19 * 60 + 35, 3, 5),  # 19:35, 3rd place
+                ("Jessica", "Brown", 19 * 60 + 42, 4, 4),  # 19:42, 4th place
+                ("Amanda", "Miller", 19 * 60 + 50, 5, 3),  # 19:50, 5th place
+                ("Rachel", "Garcia", 19 * 60 + 58, 6, 2),  # 19:58, 6th place
+                ("Lauren", "Martinez", 20 * 60 + 5, 7, 1), # 20:05, 7th place
             ]
             
-            for first_name, last_name, minutes, seconds, place, points in girls_results:
-                athlete_result = conn.execute(
-                    text("""
-                        INSERT INTO athletes (first_name, last_name, gender, graduation_year)
-                        VALUES (:first_name, :last_name, :gender, :grad_year)
-                        RETURNING id
-                    """),
-                    {
-                        "first_name": first_name,
-                        "last_name": last_name,
-                        "gender": "female",
-                        "grad_year": 2025
-                    }
-                )
-                athlete_id = str(athlete_result.fetchone()[0])
-                
-                time_seconds = minutes * 60 + seconds
+            for first_name, last_name, time_seconds, place, points in girls_results:
+                athlete_id = uuid.uuid4()
+                athlete_rows.append((athlete_id, first_name, last_name, "female", 2025))
                 
-                conn.execute(
-                    text("""
-                        INSERT INTO results (race_id, athlete_id, time_seconds, place, varsity_points)
-                        VALUES (:race_id, :athlete_id, :time_seconds, :place, :points)
-                    """),
-                    {
-                        "race_id": girls_race_id,
-                        "athlete_id": athlete_id,
-                        "time_seconds": time_seconds,
-                        "place": place,
-                        "points": points
-                    }
-                )
+                result_rows.append((girls_race_id, athlete_id, time_seconds, place, points))
                 
-                print(f"Added athlete: {first_name} {last_name} - {minutes}:{seconds:02d} (Place: {place})")
+                added_lines.append(f"Added athlete: {first_name} {last_name} - {time_seconds // 60}:{time_seconds % 60:02d} (Place: {place})")
             
-            conn.commit()
-            print("\n✅ Sample data inserted successfully!")
-            print("🌐 You can now view the dashboard at http://localhost")
-            print("📊 Try the following features:")
-            print("   - Team Statistics: View best times by gender")
-            print("   - Athletes List: Browse individual athlete profiles")  
-            print("   - CSV Export: Download performance data")
+            # Bulk load athletes, then results, over the same DBAPI connection so
+            # both COPYs run inside this transaction
+            cursor = conn.connection.cursor()
+            copy_rows(cursor, ATHLETES_COPY_SQL, athlete_rows)
+            copy_rows(cursor, RESULTS_COPY_SQL, result_rows)
+            cursor.close()
+        
+        print("\n".join(added_lines))
+        print("\n✅ Sample data inserted successfully!")
+        print("🌐 You can now view the dashboard at http://localhost")
+        print("📊 Try the following features:")
+        print("   - Team Statistics: View best times by gender")
+        print("   - Athletes List: Browse individual athlete profiles")  
+        print("   - CSV Export: Download performance data")
             
     except Exception as e:
         print(f"Error inserting sample data: {e}")
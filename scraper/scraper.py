@@ -9,24 +9,315 @@ It reads configuration from a YAML file to determine which races to scrape.
 import os
 import sys
 import re
-import time
 import yaml
 import logging
 import argparse
+import contextlib
+import functools
+import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 import psycopg2
-from psycopg2.extras import DictCursor
-from sqlalchemy import create_engine, text
+from psycopg2.extras import execute_values
+from sqlalchemy import bindparam, create_engine, text
 from dataclasses import dataclass
 
+# Prefer the C-backed lxml parser; fall back to the stdlib parser if it isn't installed
+try:
+    import lxml
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Use the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YAML_LOADER
+except ImportError:
+    from yaml import SafeLoader as YAML_LOADER
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Maximum number of result pages downloaded at the same time
+PREFETCH_WORKERS = 4
+
+# Time formats accepted by parse_time_to_seconds, tried in order. Each pattern is
+# paired with the seconds multiplier of its whole-number groups; a trailing group
+# beyond those is the fractional part (1 digit = tenths, 2 digits = hundredths)
+_TIME_FORMATS = (
+    (r'(\d{1,2}):(\d{2}):(\d{2})\.(\d{1,2})', (3600, 60, 1)),  # H:MM:SS.s or H:MM:SS.ss (for very long times)
+    (r'(\d{1,2}):(\d{2}):(\d{2})', (60, 1)),                   # MM:SS:ss (hundredths)
+    (r'(\d{1,2}):(\d{2})\.(\d{1,2})', (60, 1)),                # MM:SS.s or MM:SS.ss
+    (r'(\d{1,2}):(\d{2})', (60, 1)),                           # MM:SS
+    (r'(\d{3,4})\.(\d{1,2})', (1,)),                           # SSS.s or SSS.ss or SSSS.s or SSSS.ss (seconds only)
+)
+
+# All formats as one alternation; Python tries the alternatives left to right,
+# so this picks the same format as matching each pattern in turn
+_TIME_RE = re.compile('|'.join(f'(?:{pattern})' for pattern, _ in _TIME_FORMATS))
+
+def _index_time_groups(formats) -> Dict[int, Tuple[int, int, Tuple[int, ...]]]:
+    """Map the last group of each _TIME_RE alternative to (first group, group count, multipliers)."""
+    # Every group in an alternative must match, so match.lastindex identifies
+    # which alternative (and so which format) matched
+    index = {}
+    first_group = 1
+    for pattern, multipliers in formats:
+        group_count = re.compile(pattern).groups
+        index[first_group + group_count - 1] = (first_group, group_count, multipliers)
+        first_group += group_count
+    return index
+
+_TIME_GROUPS = _index_time_groups(_TIME_FORMATS)
+
+def _mmss_to_seconds(time_str: str) -> Optional[float]:
+    """Convert the common M:SS.ss / MM:SS.ss shape to seconds without the regex, or None for any other shape."""
+    colon = len(time_str) - 6
+    if colon not in (1, 2) or time_str[colon] != ':' or time_str[colon + 3] != '.':
+        return None
+    minutes = time_str[:colon]
+    seconds = time_str[colon + 1:colon + 3]
+    hundredths = time_str[colon + 4:]
+    # isdecimal() accepts exactly what \d does, so this agrees with _TIME_RE
+    if not (minutes.isdecimal() and seconds.isdecimal() and hundredths.isdecimal()):
+        return None
+    return float(int(minutes) * 60 + int(seconds)) + int(hundredths) / 100.0
+
+@functools.lru_cache(maxsize=8192)
+def _time_str_to_seconds(time_str: str) -> Optional[float]:
+    """Convert a stripped time string to seconds, or None if no format matches."""
+    # Pure and cached: many results in a race share the same time string
+    total = _mmss_to_seconds(time_str)
+    if total is not None:
+        return total
+    match = _TIME_RE.match(time_str)
+    if not match:
+        return None
+    first_group, group_count, multipliers = _TIME_GROUPS[match.lastindex]
+    groups = match.groups()[first_group - 1:first_group - 1 + group_count]
+    total = float(sum(int(group) * multiplier for group, multiplier in zip(groups, multipliers)))
+    if len(groups) > len(multipliers):
+        # Handle variable decimal places (1 or 2 digits)
+        fractional = groups[-1]
+        total += int(fractional) / (10.0 ** len(fractional))
+    return total
+
+# MileSplit raw pre-formatted line: Place Div/Tot Bib# Name Sex School Time Pace
+_PRE_LINE_RE = re.compile(r'^\s*(\d+)\s+\d+/\d+\s+\d+\s+(.+?)\s+(M|F)\s+(.+?)\s+(\d{1,2}:\d{2}(?:\.\d{2})?)\s+\d+:\d+\s*$')
+
+# MileSplit pipe-delimited text result line
+_RESULT_PATTERN_RE = re.compile(r'\|\s*(\d+)\s*\|[^|]*\|\s*([^|]+?)\s*\|\s*(\d+)\s*\|[^|]*\|\s*(\d{1,2}:\d{2}(?:\.\d{2})?|\d{2}:\d{2}:\d{2}(?:\.\d{2})?)\s*\|')
+
+# Gender and race class keywords in headers. These are plain substring matches,
+# like the checks they replace: 'female' also contains 'male', so test female first
+_GENDER_FEMALE_RE = re.compile(r'girls|female|women', re.IGNORECASE)
+_GENDER_MALE_RE = re.compile(r'boys|male|men', re.IGNORECASE)
+_JV_RE = re.compile(r'jv |junior varsity', re.IGNORECASE)
+_VARSITY_RE = re.compile(r'varsity', re.IGNORECASE)
+_FRESHMAN_RE = re.compile(r'freshman', re.IGNORECASE)
+
+# Common school indicators that help identify where an athlete name starts
+_SCHOOL_INDICATORS = frozenset({'high', 'school', 'middle', 'academy', 'charter', 'classical'})
+
+# The default algorithm only looks at <pre> blocks and tables; skip building the rest of the page
+_RESULTS_STRAINER = SoupStrainer(['pre', 'table'])
+# The John Martin format reads only the first results table
+_TABLE_STRAINER = SoupStrainer('table')
+# The Thornton combined format keeps every race in a single <pre> block
+_PRE_STRAINER = SoupStrainer('pre')
+
+# The John Martin format rejects the whole file on any time cell that isn't
+# exactly one of these shapes (_TIME_RE alone would accept trailing text)
+_JM_TIME_RE = re.compile(r'^(\d{1,2}:\d{2}(?:\.\d{2})?|\d{1,2}:\d{2}:\d{2}(?:\.\d{2})?|\d{2,4}\.\d{2})$')
+
+_TABLE_TIME_RE = re.compile(r'\d{1,2}:\d{2}')
+
+_PLACE_RE = re.compile(r'(\d+)')
+
+# Thornton combined format: section boundaries and fixed-width result rows
+_THORNTON_END_RES = [
+    re.compile(r"Team Scores", re.IGNORECASE),
+    re.compile(r"JV (?:Boys|Girls) 5000 Meter Run", re.IGNORECASE),
+    re.compile(r"Varsity (?:Boys|Girls) 5000 Meter Run", re.IGNORECASE),
+]
+_THORNTON_TIME_RE = re.compile(r'(\d{1,2}:\d{2}\.\d{2})')
+_MULTI_SPACE_RE = re.compile(r'\s{2,}')
+_PLACE_NAME_RE = re.compile(r'^(\d+)\s+(.+)$')
+_GRADE_SCHOOL_RE = re.compile(r'^(\d{1,2})\s+(.+)$')
+_THORNTON_ROW_RE = re.compile(r'^\s*(\d+)\s+(.+?)\s+(\d{2})\s+(.+?)\s+(\d{1,2}:\d{2}\.\d{2})\s*(\d*)\s*$')
+
+# Raw combined format: header rows and result lines
+_EQUALS_LINE_RE = re.compile(r'^=+$')
+_RAW_HEADER_RE = re.compile(r'^\s*Pl\s+Athlete\s+Yr\s+Team\s+Time')
+_RAW_RESULT_RE = re.compile(r'^\s*(\d+)\s+([A-Za-z\'\-\.\s]+?)\s+(\d{1,2})\s+(.+?)\s+(\d{1,2}:\d{2}\.\d{2})(?:\s+(\d+))?\s*$')
+# Lines that end a raw combined results section (Team Results, another race, etc.)
+_RAW_STOP_RES = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'^Team\s+Results',
+    r'^Team\s+Scores',
+    r'^Scoring\s+Summary',
+    r'^\s*(JV|Varsity)\s+(Boys|Girls)',  # Another race section
+    r'^\s*\d+\.\s*[A-Za-z]+\s+[A-Za-z]+.*Team\s+Results',  # Team scoring line
+    r'^={5,}',  # Section dividers with multiple equals signs
+    r'^\s*Pl\s+Team\s+Points',  # Team scoring header
+)]
+
+# Every line boundary str.splitlines() recognizes
+_LINE_BREAK_RE = re.compile(r'\r\n|[\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]')
+
+def _iter_lines(text: str, start: int = 0):
+    """Yield the lines of text[start:] one at a time, exactly as text[start:].splitlines() would."""
+    # Lazy so a parse that stops at the end of its section never splits the rest of the page
+    pos = start
+    for line_break in _LINE_BREAK_RE.finditer(text, start):
+        yield text[pos:line_break.start()]
+        pos = line_break.end()
+    if pos < len(text):
+        yield text[pos:]
+
+def _table_has_time(table) -> bool:
+    """Return True if the table's text contains a time."""
+    # Check text nodes one at a time first: a match stops the scan without joining
+    # the whole table's text, and most cells have no ':' so never reach the regex
+    if any(':' in string and _TABLE_TIME_RE.search(string) for string in table.strings):
+        return True
+    # A time split across nodes (e.g. <b>16</b>:45.2) only shows up in the joined text
+    return bool(_TABLE_TIME_RE.search(table.get_text()))
+
+# Configuration gender values mapped to database gender values
+GENDER_DB_MAP = {
+    'boys': 'male',
+    'girls': 'female',
+    'mixed': 'mixed',
+    'male': 'male',  # Already correct
+    'female': 'female'  # Already correct
+}
+
+# Map common school name variations to standardized names
+SCHOOL_NAME_MAPPINGS = {
+    'Fort Collins': 'Fort Collins High School',
+    'Fort Collins HS': 'Fort Collins High School',
+    'Fort Collins High Sc': 'Fort Collins High School',
+    'FCHS': 'Fort Collins High School',
+    'Fossil Ridge HS': 'Fossil Ridge High School',
+    'Fossil Ridge': 'Fossil Ridge High School',
+    'Rocky Mountain HS': 'Rocky Mountain High School',
+    'Rocky Mountain': 'Rocky Mountain High School',
+}
+
+# Truncated school names found in Thornton results mapped to full names
+THORNTON_SCHOOL_MAPPINGS = {
+    'Fort Collins': 'Fort Collins High School',  # Desert Twilight format
+    'Fort Collins High Sc': 'Fort Collins High School',
+    'Fossil Ridge High Sc': 'Fossil Ridge High School', 
+    'Rocky Mountain High': 'Rocky Mountain High School',
+    'Denver East High Sch': 'Denver East High School',
+    'Clear Creek High Sch': 'Clear Creek High School',
+    'Fort Lupton High Sch': 'Fort Lupton High School',
+    'Westminster High Sch': 'Westminster High School',
+    'Wheat Ridge High Sch': 'Wheat Ridge High School',
+    'Cheyenne Central Hig': 'Cheyenne Central High School',
+    'Cheyenne East High S': 'Cheyenne East High School',
+    'Prospect Ridge Acade': 'Prospect Ridge Academy',
+    'Frederick High Schoo': 'Frederick High School',
+    'Ascent Classical Aca': 'Ascent Classical Academy of Northern Colorado',
+    'Ascent Classical Academy of Nort': 'Ascent Classical Academy of Northern Colorado'
+}
+
+# Names and schools repeat across a race (a few dozen schools for hundreds of
+# runners), so the normalizers are pure module-level functions behind a cache
+@functools.lru_cache(maxsize=4096)
+def _normalize_name(name: str) -> str:
+    """Capitalize first letter, lower case the rest for each word in a name."""
+    return ' '.join([w.capitalize() for w in name.split()])
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_school_name(school: str) -> str:
+    """Normalize school names to standard formats."""
+    school = school.strip()
+    
+    # Check exact matches first
+    if school in SCHOOL_NAME_MAPPINGS:
+        return SCHOOL_NAME_MAPPINGS[school]
+    
+    # Check for partial matches and common patterns
+    if school.endswith(' HS') and not school.endswith(' High School'):
+        # Convert "School Name HS" to "School Name High School"
+        base_name = school[:-3].strip()
+        return f"{base_name} High School"
+    
+    return school
+
+# Statements used by store_race_results, built once at import instead of per call
+VENUE_UPSERT_SQL = text("""
+    INSERT INTO venues (name) VALUES (:name)
+    ON CONFLICT (name) DO UPDATE SET name = EXCLUDED.name
+    RETURNING id
+""")
+MEET_SELECT_SQL = text("""
+    SELECT id FROM meets 
+    WHERE name = :name AND meet_date = :meet_date AND venue_id = :venue_id
+""")
+MEET_INSERT_SQL = text("""
+    INSERT INTO meets (name, meet_date, venue_id, season, milesplit_url)
+    VALUES (:name, :meet_date, :venue_id, :season, :url)
+    RETURNING id
+""")
+RACE_SELECT_SQL = text("""
+    SELECT id FROM races 
+    WHERE meet_id = :meet_id AND name = :name AND distance = :distance 
+    AND race_class = :race_class AND gender = :gender
+""")
+RACE_INSERT_SQL = text("""
+    INSERT INTO races (meet_id, name, distance, race_class, gender)
+    VALUES (:meet_id, :name, :distance, :race_class, :gender)
+    RETURNING id
+""")
+# Identity of every race stored for the given meets, used to skip races before fetching them
+RACE_KEYS_SQL = text("""
+    SELECT m.name, m.meet_date, v.name, r.name, r.distance, r.race_class, r.gender
+    FROM races r
+    JOIN meets m ON r.meet_id = m.id
+    JOIN venues v ON m.venue_id = v.id
+    WHERE m.name IN :meet_names
+""").bindparams(bindparam('meet_names', expanding=True))
+# Unique indexes the ON CONFLICT upserts and inserts below depend on; databases
+# created before they were added to init.sql need database/add_upsert_indexes.sql
+UPSERT_INDEXES = ('idx_athletes_identity', 'idx_venues_name', 'idx_results_identity')
+UPSERT_INDEXES_SQL = text("""
+    SELECT indexname FROM pg_indexes WHERE indexname IN :index_names
+""").bindparams(bindparam('index_names', expanding=True))
+# Secondary results indexes (as defined in database/init.sql) that bulk_load_context
+# drops during a full reload; idx_results_identity stays because the inserts rely on it
+RESULTS_BULK_LOAD_INDEXES = {
+    'idx_results_race': 'CREATE INDEX IF NOT EXISTS idx_results_race ON results(race_id)',
+    'idx_results_athlete': 'CREATE INDEX IF NOT EXISTS idx_results_athlete ON results(athlete_id)',
+    'idx_results_time': 'CREATE INDEX IF NOT EXISTS idx_results_time ON results(time_seconds)',
+}
+# execute_values templates: %s expands to the VALUES rows
+ATHLETES_INSERT_SQL = """
+    INSERT INTO athletes (first_name, last_name, gender, school, graduation_year)
+    VALUES %s
+    ON CONFLICT (first_name, last_name, gender, school) DO NOTHING
+    RETURNING id, first_name, last_name, gender, school
+"""
+ATHLETES_SELECT_SQL = """
+    SELECT id, first_name, last_name, gender, school FROM athletes
+    WHERE (first_name, last_name, gender, school) IN (VALUES %s)
+"""
+RESULTS_INSERT_SQL = """
+    INSERT INTO results (race_id, athlete_id, time_seconds, place, varsity_points)
+    VALUES %s
+    ON CONFLICT (race_id, athlete_id, place) DO NOTHING
+    RETURNING id
+"""
+
+@dataclass(slots=True)
 class RaceConfig:
     meet_name: str
     race_name: str
@@ -42,7 +333,7 @@ class RaceConfig:
     results_title: Optional[str] = None
     race_number: Optional[int] = None
 
-@dataclass
+@dataclass(slots=True)
 class Athlete:
     first_name: str
     last_name: str
@@ -53,7 +344,12 @@ class Athlete:
     def __post_init__(self):
         pass
 
-@dataclass
+    @property
+    def key(self) -> Tuple[str, str, str, str]:
+        """Columns that identify an athlete row (matches idx_athletes_identity)."""
+        return (self.first_name, self.last_name, self.gender, self.school)
+
+@dataclass(slots=True)
 class Result:
     athlete: Athlete
     time_seconds: float  # Changed to float to support fractional seconds
@@ -61,13 +357,70 @@ class Result:
     varsity_points: int = 0
 
 class MileSplitScraper:
-    def __init__(self, database_url: str):
+    def __init__(self, database_url: Optional[str]):
         self.database_url = database_url
-        self.engine = create_engine(database_url)
+        # Everything runs on one thread, so a small pool is plenty; pre-ping so a
+        # connection dropped during a long scrape is replaced instead of failing a race,
+        # and recycle connections before idle timeouts along the way can cut them.
+        # Without a database_url this is a parser-only scraper with no engine
+        self.engine = create_engine(
+            database_url,
+            pool_pre_ping=True,
+            pool_size=4,
+            pool_recycle=1800
+        ) if database_url else None
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
+        # Keep a connection per prefetch worker alive, and back off and retry when a
+        # server is rate limiting or briefly unavailable
+        retry = Retry(total=5, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504], allowed_methods=['GET'])
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=PREFETCH_WORKERS, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        # Responses downloaded ahead of time by prefetch_pages, keyed by URL
+        self._page_cache: Dict[str, requests.Response] = {}
+        # Ids already resolved during this run, so repeat venues and athletes
+        # (same meet, same season) don't cost another round-trip
+        self._venue_cache: Dict[str, uuid.UUID] = {}
+        self._athlete_cache: Dict[Tuple[str, str, str, str], uuid.UUID] = {}
+
+    def fetch_page(self, url: str) -> requests.Response:
+        """Return the response for a URL, using the prefetched copy when there is one."""
+        response = self._page_cache.get(url)
+        if response is None:
+            response = self.session.get(url, timeout=30)
+        return response
+
+    def take_prefetched_page(self, url: str, last_use: bool) -> Optional[requests.Response]:
+        """Return the prefetched response for a URL, dropping it from the cache on its last use."""
+        if last_use:
+            return self._page_cache.pop(url, None)
+        return self._page_cache.get(url)
+
+    def prefetch_pages(self, urls: List[str]):
+        """Download all result pages concurrently so the scrape loop doesn't wait on each request in turn."""
+        # Several races are often published on the same page; only fetch it once
+        pending = [url for url in dict.fromkeys(urls) if url not in self._page_cache]
+        if not pending:
+            return
+        
+        logger.info("Prefetching %s result pages...", len(pending))
+        
+        def fetch(url):
+            try:
+                return url, self.session.get(url, timeout=30)
+            except requests.RequestException as e:
+                # Leave it out of the cache; the scrape will retry and report the error
+                logger.warning("Error prefetching %s: %s", url, e)
+                return url, None
+        
+        # Keep the number of simultaneous requests small to stay polite to the servers
+        with ThreadPoolExecutor(max_workers=PREFETCH_WORKERS) as executor:
+            for url, response in executor.map(fetch, pending):
+                if response is not None:
+                    self._page_cache[url] = response
 
     def clear_database(self):
         """Clear all existing race data from the database before scraping."""
@@ -75,97 +428,67 @@ class MileSplitScraper:
         
         try:
             with self.engine.begin() as conn:
-                # Delete in proper order due to foreign key constraints
-                conn.execute(text("DELETE FROM results"))
-                conn.execute(text("DELETE FROM races"))  
-                conn.execute(text("DELETE FROM meets"))
-                conn.execute(text("DELETE FROM venues"))
-                conn.execute(text("DELETE FROM athletes"))
+                # Truncate every race table in one statement; listing them together
+                # satisfies the foreign keys between them without CASCADE
+                conn.execute(text("TRUNCATE TABLE results, races, meets, venues, athletes"))
+                self._venue_cache.clear()
+                self._athlete_cache.clear()
                 logger.info("Database cleared successfully")
         except Exception as e:
-            logger.error(f"Error clearing database: {e}")
+            logger.error("Error clearing database: %s", e)
             raise
 
+    @contextlib.contextmanager
+    def bulk_load_context(self):
+        """Drop the secondary results indexes for a bulk load and rebuild them afterwards."""
+        # Building each index once over the loaded table is cheaper than updating
+        # it for every inserted row
+        logger.info("Dropping secondary results indexes for bulk load...")
+        with self.engine.begin() as conn:
+            conn.execute(text(f"DROP INDEX IF EXISTS {', '.join(RESULTS_BULK_LOAD_INDEXES)}"))
+        try:
+            yield
+        finally:
+            logger.info("Rebuilding results indexes...")
+            with self.engine.begin() as conn:
+                for create_index_sql in RESULTS_BULK_LOAD_INDEXES.values():
+                    conn.execute(text(create_index_sql))
+                conn.execute(text("ANALYZE results"))
+
     def load_race_config(self, config_path: str) -> List[RaceConfig]:
         """Load race configuration from YAML file."""
         try:
             with open(config_path, 'r') as file:
-                config = yaml.safe_load(file)
+                config = yaml.load(file, Loader=YAML_LOADER)
                 races = []
                 for race_data in config.get('races', []):
                     races.append(RaceConfig(**race_data))
                 return races
         except Exception as e:
-            logger.error(f"Error loading config file {config_path}: {e}")
+            logger.error("Error loading config file %s: %s", config_path, e)
             return []
 
     def map_gender_for_db(self, config_gender: str) -> str:
         """Map configuration gender values to database gender values."""
-        gender_map = {
-            'boys': 'male',
-            'girls': 'female',
-            'mixed': 'mixed',
-            'male': 'male',  # Already correct
-            'female': 'female'  # Already correct
-        }
-        return gender_map.get(config_gender.lower(), config_gender.lower())
+        config_gender = config_gender.lower()
+        return GENDER_DB_MAP.get(config_gender, config_gender)
 
     def parse_time_to_seconds(self, time_str: str) -> Optional[float]:
         """Parse time string (MM:SS.ss, MM:SS, or extended formats) to total seconds with fractional support."""
         time_str = time_str.strip()
-        patterns = [
-            r'(\d{1,2}):(\d{2}):(\d{2})\.(\d{1,2})', # H:MM:SS.s or H:MM:SS.ss (for very long times)
-            r'(\d{1,2}):(\d{2}):(\d{2})',        # MM:SS:ss (hundredths)
-            r'(\d{1,2}):(\d{2})\.(\d{1,2})',      # MM:SS.s or MM:SS.ss
-            r'(\d{1,2}):(\d{2})',              # MM:SS
-            r'(\d{3,4})\.(\d{1,2})'              # SSS.s or SSS.ss or SSSS.s or SSSS.ss (seconds only)
-        ]
-        for i, pattern in enumerate(patterns):
-            match = re.match(pattern, time_str)
-            if match:
-                groups = match.groups()
-                if i == 0:  # H:MM:SS.s or H:MM:SS.ss
-                    hours, minutes, seconds, fractional = groups
-                    # Handle variable decimal places (1 or 2 digits)
-                    if len(fractional) == 1:
-                        fractional_seconds = float(int(fractional)) / 10.0
-                    else:
-                        fractional_seconds = float(int(fractional)) / 100.0
-                    total = float(int(hours) * 3600 + int(minutes) * 60 + int(seconds)) + fractional_seconds
-                elif i == 1:  # MM:SS:ss (hundredths)
-                    minutes, seconds, hundredths = groups
-                    total = float(int(minutes) * 60 + int(seconds)) + float(int(hundredths)) / 100.0
-                elif i == 2:  # MM:SS.s or MM:SS.ss
-                    minutes, seconds, fractional = groups
-                    # Handle variable decimal places (1 or 2 digits)
-                    if len(fractional) == 1:
-                        fractional_seconds = float(int(fractional)) / 10.0
-                    else:
-                        fractional_seconds = float(int(fractional)) / 100.0
-                    total = float(int(minutes) * 60 + int(seconds)) + fractional_seconds
-                elif i == 3:  # MM:SS
-                    minutes, seconds = groups
-                    total = float(int(minutes) * 60 + int(seconds))
-                elif i == 4:  # SSS.s or SSS.ss or SSSS.s or SSSS.ss
-                    seconds, fractional = groups
-                    # Handle variable decimal places (1 or 2 digits)
-                    if len(fractional) == 1:
-                        fractional_seconds = float(int(fractional)) / 10.0
-                    else:
-                        fractional_seconds = float(int(fractional)) / 100.0
-                    total = float(int(seconds)) + fractional_seconds
-                # Sanity check: reject times over 1 hour (3600 seconds)
-                if total > 3600:
-                    print(f"ERROR: Parsed time exceeds sanity threshold: {total} seconds from '{time_str}'")
-                    logger.error(f"Sanity check failed: time {total} from '{time_str}'")
-                    sys.exit(1)
-                return total
-        logger.warning(f"Could not parse time format: {time_str}")
+        total = _time_str_to_seconds(time_str)
+        if total is not None:
+            # Sanity check: reject times over 1 hour (3600 seconds)
+            if total > 3600:
+                print(f"ERROR: Parsed time exceeds sanity threshold: {total} seconds from '{time_str}'")
+                logger.error("Sanity check failed: time %s from '%s'", total, time_str)
+                sys.exit(1)
+            return total
+        logger.warning("Could not parse time format: %s", time_str)
         return None
 
     def scrape_john_martin_format(self, source: str, is_file: bool = False, gender: str = 'unknown') -> List[Result]:
         """Scrape race results using the John Martin format (custom algorithm)."""
-        import re
         try:
             if is_file:
                 if not os.path.exists(source):
@@ -173,17 +496,16 @@ class MileSplitScraper:
                     return []
                 with open(source, 'r', encoding='utf-8') as f:
                     html_content = f.read()
-                soup = BeautifulSoup(html_content, 'html.parser')
+                soup = BeautifulSoup(html_content, HTML_PARSER, parse_only=_TABLE_STRAINER)
             else:
-                response = self.session.get(source, timeout=30)
+                response = self.fetch_page(source)
                 response.raise_for_status()
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = BeautifulSoup(response.content, HTML_PARSER, parse_only=_TABLE_STRAINER)
             table = soup.find('table')
             if not table:
                 logger.warning("No table found in John Martin format file.")
                 return []
             results = []
-            time_pattern = re.compile(r'^(\d{1,2}:\d{2}(?:\.\d{2})?|\d{1,2}:\d{2}:\d{2}(?:\.\d{2})?|\d{2,4}\.\d{2})$')
             rows = table.find_all('tr')
             # Skip header row if present
             if rows and len(rows) > 1:
@@ -196,7 +518,7 @@ class MileSplitScraper:
                 name_val = cells[1].get_text(strip=True)
                 school_val = cells[2].get_text(strip=True)
                 time_val = cells[3].get_text(strip=True)
-                if not time_pattern.match(time_val):
+                if not _JM_TIME_RE.match(time_val):
                     logger.error(f"Invalid time format found in row: place='{place_val}', name='{name_val}', school='{school_val}', time='{time_val}'")
                     print(f"ERROR: Invalid time format in John Martin file: place='{place_val}', name='{name_val}', school='{school_val}', time='{time_val}'")
                     sys.exit(1)
@@ -209,9 +531,9 @@ class MileSplitScraper:
                         print(f"ERROR: Could not parse time format: place='{place_val}', name='{name_val}', school='{school_val}', time='{time_val}'")
                         logger.error(f"Could not parse time format: place='{place_val}', name='{name_val}', school='{school_val}', time='{time_val}'")
                         sys.exit(1)
-                    name_parts = name.split()
+                    name_parts = name.split(None, 1)
                     first_name = name_parts[0]
-                    last_name = ' '.join(name_parts[1:]) if len(name_parts) > 1 else ''
+                    last_name = name_parts[1] if len(name_parts) > 1 else ''
                     first_name = self.normalize_name(first_name)
                     last_name = self.normalize_name(last_name)
                     athlete = Athlete(
@@ -238,7 +560,6 @@ class MileSplitScraper:
 
     def scrape_thornton_combined_format(self, source: str, is_file: bool = False, gender: str = 'unknown', race_config: Optional[RaceConfig] = None) -> List[Result]:
         """Scrape race results using the Thornton combined format (custom algorithm)."""
-        import re
         try:
             if is_file:
                 if not os.path.exists(source):
@@ -246,11 +567,11 @@ class MileSplitScraper:
                     return []
                 with open(source, 'r', encoding='utf-8') as f:
                     html_content = f.read()
-                soup = BeautifulSoup(html_content, 'html.parser')
+                soup = BeautifulSoup(html_content, HTML_PARSER, parse_only=_PRE_STRAINER)
             else:
-                response = self.session.get(source, timeout=30)
+                response = self.fetch_page(source)
                 response.raise_for_status()
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = BeautifulSoup(response.content, HTML_PARSER, parse_only=_PRE_STRAINER)
 
             # Find the pre-formatted text section
             pre_tag = soup.find('pre')
@@ -305,17 +626,11 @@ class MileSplitScraper:
             start_pos = start_match.end()
             
             # Find the end of this race section (next race header or team scores)
-            end_patterns = [
-                r"Team Scores",
-                r"JV (?:Boys|Girls) 5000 Meter Run",
-                r"Varsity (?:Boys|Girls) 5000 Meter Run"
-            ]
-            
             end_pos = len(text)
-            for pattern in end_patterns:
-                end_match = re.search(pattern, text[start_pos:], re.IGNORECASE)
+            for end_re in _THORNTON_END_RES:
+                end_match = end_re.search(text, start_pos)
                 if end_match:
-                    potential_end = start_pos + end_match.start()
+                    potential_end = end_match.start()
                     if potential_end > start_pos:
                         end_pos = potential_end
                         break
@@ -372,7 +687,7 @@ class MileSplitScraper:
             # Since split by multiple spaces doesn't work due to truncated school names, use a different approach
             
             # Try to match the specific pattern where we know the time format
-            time_match = re.search(r'(\d{1,2}:\d{2}\.\d{2})', line)
+            time_match = _THORNTON_TIME_RE.search(line)
             if time_match:
                 time_str = time_match.group(1)
                 time_start = time_match.start()
@@ -384,11 +699,11 @@ class MileSplitScraper:
                 after_time = line[time_end:].strip()
                 
                 # Parse the part before time - split by multiple spaces to separate name section from grade+school section
-                parts_before = re.split(r'\s{2,}', before_time)
+                parts_before = _MULTI_SPACE_RE.split(before_time)
                 if len(parts_before) >= 2:
                     # First part: place and name
                     place_name_part = parts_before[0].strip()
-                    place_name_match = re.match(r'^(\d+)\s+(.+)$', place_name_part)
+                    place_name_match = _PLACE_NAME_RE.match(place_name_part)
                     if not place_name_match:
                         continue
                     
@@ -397,7 +712,7 @@ class MileSplitScraper:
                     
                     # Second part: grade and school (joined if there were more parts)
                     grade_school_part = ' '.join(parts_before[1:]).strip()
-                    grade_school_match = re.match(r'^(\d{1,2})\s+(.+)$', grade_school_part)
+                    grade_school_match = _GRADE_SCHOOL_RE.match(grade_school_part)
                     if not grade_school_match:
                         continue
                         
@@ -409,7 +724,7 @@ class MileSplitScraper:
                     
                 else:
                     # Fall back to original regex
-                    match = re.match(r'^\s*(\d+)\s+(.+?)\s+(\d{2})\s+(.+?)\s+(\d{1,2}:\d{2}\.\d{2})\s*(\d*)\s*$', line)
+                    match = _THORNTON_ROW_RE.match(line)
                     if match:
                         place = int(match.group(1))
                         name = match.group(2).strip()
@@ -434,10 +749,9 @@ class MileSplitScraper:
                         continue
                     
                     # Parse name into first and last
-                    name_parts = name.split()
+                    name_parts = name.split(None, 1)
                     if len(name_parts) >= 2:
-                        first_name = name_parts[0]
-                        last_name = ' '.join(name_parts[1:])
+                        first_name, last_name = name_parts
                     else:
                         first_name = name
                         last_name = ''
@@ -491,7 +805,6 @@ class MileSplitScraper:
 
     def scrape_raw_combined_format(self, source: str, is_file: bool = False, race_config: Optional[RaceConfig] = None) -> List[Result]:
         """Scrape race results using the raw combined format (custom algorithm with results_title)."""
-        import re
         try:
             if is_file:
                 if not os.path.exists(source):
@@ -500,7 +813,7 @@ class MileSplitScraper:
                 with open(source, 'r', encoding='utf-8') as f:
                     content = f.read()
             else:
-                response = self.session.get(source, timeout=30)
+                response = self.fetch_page(source)
                 response.raise_for_status()
                 content = response.text
 
@@ -523,54 +836,40 @@ class MileSplitScraper:
                 logger.warning(f"Results title '{results_title}' not found in content")
                 return []
 
-            # Get content starting from the results_title
-            section_content = content[start_idx:]
-            lines = section_content.splitlines()
-
             results = []
             results_started = False
             header_lines_skipped = 0
             max_header_lines = 20  # Allow up to 20 lines of headers after results_title
             
-            # Skip the first line (which is the results_title itself)
-            start_line_idx = 1
+            # Stop if we reach another section, plus the patterns that depend on this race
+            stop_regexes = _RAW_STOP_RES + [
+                # Stop when we see the next race type (different from our current one)
+                re.compile(r'^Womens\s+\d+,?\d*\s+Meters' if 'Mens' in results_title else r'^Mens\s+\d+,?\d*\s+Meters', re.IGNORECASE),
+                # Stop when we see a different race level (JV vs Varsity)
+                re.compile(r'JV' if 'Varsity' in results_title else r'Varsity', re.IGNORECASE),
+            ]
+            
+            logger.info(f"Processing {len(content) - start_idx} characters from results section")
             
-            logger.info(f"Processing {len(lines)} lines from results section")
+            # Read lines starting from the results_title, skipping the first
+            # line (which is the results_title itself)
+            lines = _iter_lines(content, start_idx)
+            next(lines)
             
-            for line_idx, line in enumerate(lines[start_line_idx:], start_line_idx):
+            for line_idx, line in enumerate(lines, 1):
                 line = line.strip()
                 if not line:
                     continue
                 
                 # Skip header lines (equals signs, column headers, etc.)
-                if re.match(r'^=+$', line) or re.match(r'^\s*Pl\s+Athlete\s+Yr\s+Team\s+Time', line):
+                if _EQUALS_LINE_RE.match(line) or _RAW_HEADER_RE.match(line):
                     header_lines_skipped += 1
                     logger.debug(f"Skipping header line {line_idx}: '{line[:30]}...'")
                     continue
-                line = line.strip()
-                if not line:
-                    continue
-                
+
                 # Stop if we reach another section (Team Results, another race, etc.)
-                stop_patterns = [
-                    r'^Team\s+Results',
-                    r'^Team\s+Scores',
-                    r'^Scoring\s+Summary',
-                    r'^\s*(JV|Varsity)\s+(Boys|Girls)',  # Another race section
-                    r'^\s*\d+\.\s*[A-Za-z]+\s+[A-Za-z]+.*Team\s+Results',  # Team scoring line
-                    r'^={5,}',  # Section dividers with multiple equals signs
-                    r'^\s*Pl\s+Team\s+Points',  # Team scoring header
-                    # Stop when we see the next race type (different from our current one)
-                    r'^Womens\s+\d+,?\d*\s+Meters' if 'Mens' in results_title else r'^Mens\s+\d+,?\d*\s+Meters',
-                    # Stop when we see a different race level (JV vs Varsity)
-                    r'JV' if 'Varsity' in results_title else r'Varsity',
-                ]
-                
-                # Skip the first line (which is the results_title itself)
-                start_idx = 1
-                
-                for pattern in stop_patterns:
-                    if re.search(pattern, line, re.IGNORECASE):
+                for stop_re in stop_regexes:
+                    if stop_re.search(line):
                         logger.info(f"Stopping parse at line {line_idx}: found section delimiter '{line[:50]}...'")
                         return results
                 
@@ -578,9 +877,7 @@ class MileSplitScraper:
                 # Common formats:
                 # "  1 John Doe           12 School Name       16:42.45    1"
                 # "  1 John Doe           12 School Name       16:42.45"
-                result_pattern = r'^\s*(\d+)\s+([A-Za-z\'\-\.\s]+?)\s+(\d{1,2})\s+(.+?)\s+(\d{1,2}:\d{2}\.\d{2})(?:\s+(\d+))?\s*$'
-                
-                match = re.match(result_pattern, line)
+                match = _RAW_RESULT_RE.match(line)
                 
                 if match:
                     results_started = True
@@ -599,11 +896,10 @@ class MileSplitScraper:
                             continue
 
                         # Parse name into first and last
-                        name_parts = name.split()
+                        name_parts = name.split(None, 1)
                         
                         if len(name_parts) >= 2:
-                            first_name = name_parts[0]
-                            last_name = ' '.join(name_parts[1:])
+                            first_name, last_name = name_parts
                         else:
                             first_name = name
                             last_name = ''
@@ -660,7 +956,6 @@ class MileSplitScraper:
 
     def scrape_raw_windsor_combined_format(self, source: str, is_file: bool = False, race_config: Optional[RaceConfig] = None) -> List[Result]:
         """Scrape race results using the Windsor combined format (custom algorithm with results_title)."""
-        import re
         try:
             if is_file:
                 if not os.path.exists(source):
@@ -669,7 +964,7 @@ class MileSplitScraper:
                 with open(source, 'r', encoding='utf-8') as f:
                     content = f.read()
             else:
-                response = self.session.get(source, timeout=30)
+                response = self.fetch_page(source)
                 response.raise_for_status()
                 content = response.text
 
@@ -822,27 +1117,8 @@ class MileSplitScraper:
 
     def fix_thornton_school_name(self, school_name: str) -> str:
         """Fix truncated school names specifically from Thornton format parsing."""
-        # Mapping of truncated names to full names found in Thornton results
-        school_mappings = {
-            'Fort Collins': 'Fort Collins High School',  # Desert Twilight format
-            'Fort Collins High Sc': 'Fort Collins High School',
-            'Fossil Ridge High Sc': 'Fossil Ridge High School', 
-            'Rocky Mountain High': 'Rocky Mountain High School',
-            'Denver East High Sch': 'Denver East High School',
-            'Clear Creek High Sch': 'Clear Creek High School',
-            'Fort Lupton High Sch': 'Fort Lupton High School',
-            'Westminster High Sch': 'Westminster High School',
-            'Wheat Ridge High Sch': 'Wheat Ridge High School',
-            'Cheyenne Central Hig': 'Cheyenne Central High School',
-            'Cheyenne East High S': 'Cheyenne East High School',
-            'Prospect Ridge Acade': 'Prospect Ridge Academy',
-            'Frederick High Schoo': 'Frederick High School',
-            'Ascent Classical Aca': 'Ascent Classical Academy of Northern Colorado',
-            'Ascent Classical Academy of Nort': 'Ascent Classical Academy of Northern Colorado'
-        }
-        
         # Return the corrected name if found in mapping, otherwise return original
-        return school_mappings.get(school_name, school_name)
+        return THORNTON_SCHOOL_MAPPINGS.get(school_name, school_name)
 
     def scrape_race_results(self, source: str, is_file: bool = False, algorithm: str = 'default', gender: str = 'unknown', race_config: Optional[RaceConfig] = None) -> List[Result]:
         """Scrape race results using the selected algorithm."""
@@ -873,26 +1149,25 @@ class MileSplitScraper:
                     return []
                 with open(source, 'r', encoding='utf-8') as f:
                     html_content = f.read()
-                soup = BeautifulSoup(html_content, 'html.parser')
             else:
-                response = self.session.get(source, timeout=30)
+                response = self.fetch_page(source)
                 response.raise_for_status()
-                soup = BeautifulSoup(response.content, 'html.parser')
+                html_content = response.content
+            soup = BeautifulSoup(html_content, HTML_PARSER, parse_only=_RESULTS_STRAINER)
             results = []
-            pre_tag = soup.find('pre')
+            # Collect the <pre> block and candidate tables in a single walk of the tree
+            candidates = soup.find_all(['pre', 'table'])
+            pre_tag = next((tag for tag in candidates if tag.name == 'pre'), None)
             if pre_tag:
                 results = self.parse_pre_formatted_results(pre_tag.get_text())
                 if results:
                     return results
-            possible_tables = soup.find_all('table')
-            results_table = None
-            for table in possible_tables:
-                table_text = table.get_text()
-                if re.search(r'\d{1,2}:\d{2}', table_text):
-                    results_table = table
-                    break
+            possible_tables = [tag for tag in candidates if tag.name == 'table']
+            # The results table is the first one containing a time
+            results_table = next((table for table in possible_tables if _table_has_time(table)), None)
             if not results_table:
-                return self.parse_results_from_text(soup.get_text())
+                # The text fallback needs the whole page, so parse it in full only here
+                return self.parse_results_from_text(BeautifulSoup(html_content, HTML_PARSER).get_text())
             rows = results_table.find_all('tr')
             header_processed = False
             for row in rows:
@@ -925,7 +1200,6 @@ class MileSplitScraper:
 
     def scrape_desert_twilight_format(self, source: str, is_file: bool = False, race_config: Optional[RaceConfig] = None) -> List[Result]:
         """Scrape race results using the Desert Twilight format."""
-        import re
         try:
             if is_file:
                 if not os.path.exists(source):
@@ -934,7 +1208,7 @@ class MileSplitScraper:
                 with open(source, 'r', encoding='utf-8') as f:
                     content = f.read()
             else:
-                response = self.session.get(source, timeout=30)
+                response = self.fetch_page(source)
                 response.raise_for_status()
                 content = response.text
 
@@ -1153,7 +1427,7 @@ class MileSplitScraper:
                 with open(source, 'r', encoding='utf-8') as f:
                     content = f.read()
             else:
-                response = self.session.get(source, timeout=30)
+                response = self.fetch_page(source)
                 response.raise_for_status()
                 content = response.text
 
@@ -1309,7 +1583,7 @@ class MileSplitScraper:
                 with open(source, 'r', encoding='utf-8') as f:
                     content = f.read()
             else:
-                response = self.session.get(source, timeout=30)
+                response = self.fetch_page(source)
                 response.raise_for_status()
                 content = response.text
 
@@ -1445,7 +1719,7 @@ class MileSplitScraper:
                 with open(source, 'r', encoding='utf-8') as f:
                     content = f.read()
             else:
-                response = self.session.get(source, timeout=30)
+                response = self.fetch_page(source)
                 response.raise_for_status()
                 content = response.text
 
@@ -1721,22 +1995,24 @@ class MileSplitScraper:
             # Example: "    1   1/124   3392 Ryan Ruffer                                  M   Fossil Ridge High School                   15:57  5:08"
             if len(line) < 50:  # Skip short lines
                 continue
+            if not line[0].isdigit():  # Data lines start with the place
+                continue
                 
             # Try to extract place, bib, name, gender, school, and time using regex
             # The format appears to be: Place Div/Tot Bib# Name Sex School Time Pace
-            match = re.match(r'^\s*(\d+)\s+\d+/\d+\s+\d+\s+(.+?)\s+(M|F)\s+(.+?)\s+(\d{1,2}:\d{2}(?:\.\d{2})?)\s+\d+:\d+\s*$', line)
+            match = _PRE_LINE_RE.match(line)
             
             if match:
                 place = int(match.group(1))
                 name = match.group(2).strip()
-                gender = match.group(3).strip()
+                gender = match.group(3)
                 school = match.group(4).strip()
-                time_str = match.group(5).strip()
+                time_str = match.group(5)
                 
                 # Parse time to seconds
                 time_seconds = self.parse_time_to_seconds(time_str)
                 if time_seconds is None:
-                    logger.warning(f"Could not parse time: {time_str}")
+                    logger.warning("Could not parse time: %s", time_str)
                     continue
                 
                 # Parse name into first and last
@@ -1765,7 +2041,7 @@ class MileSplitScraper:
                 )
                 
                 results.append(result)
-                logger.debug(f"Parsed: {place}. {first_name} {last_name} ({gender_str}) - {time_str}")
+                logger.debug("Parsed: %s. %s %s (%s) - %s", place, first_name, last_name, gender_str, time_str)
         
         # Validate that the highest place number matches the total number of results
         if results:
@@ -1774,11 +2050,11 @@ class MileSplitScraper:
                 max_place = max(places)
                 total_results = len(results)
                 if max_place != total_results:
-                    logger.warning(f"Place number validation failed: highest place is {max_place} but total results is {total_results}. Some results may be missing.")
+                    logger.warning("Place number validation failed: highest place is %s but total results is %s. Some results may be missing.", max_place, total_results)
                 else:
-                    logger.info(f"Place number validation passed: {max_place} places match {total_results} total results")
+                    logger.info("Place number validation passed: %s places match %s total results", max_place, total_results)
         
-        logger.info(f"Parsed {len(results)} results from pre-formatted text")
+        logger.info("Parsed %s results from pre-formatted text", len(results))
         return results
 
     def parse_results_from_text(self, text: str) -> List[Result]:
@@ -1786,15 +2062,16 @@ class MileSplitScraper:
         results = []
         lines = text.split('\n')
         
-        # Debug: Log some sample lines to see what we're working with
-        logger.info("Sample lines from webpage:")
-        sample_lines = [line.strip() for line in lines if line.strip() and '|' in line][:10]
-        for line in sample_lines:
-            logger.info(f"  {line}")
+        # Debug: Log some sample lines to see what we're working with (only
+        # scan for them when the messages will actually be emitted)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Sample lines from webpage:")
+            sample_lines = [line.strip() for line in lines if line.strip() and '|' in line][:10]
+            for line in sample_lines:
+                logger.info("  %s", line)
         
-        # Look for lines that match the MileSplit result pattern
+        # Look for lines that match the MileSplit result pattern (_RESULT_PATTERN_RE)
         # Example: "| 1 |   | Fossil Ridge High School Joey Benson | 9 | Fossil Ridge High School | 18:21.00 | 1 |"
-        result_pattern = r'\|\s*(\d+)\s*\|[^|]*\|\s*([^|]+?)\s*\|\s*(\d+)\s*\|[^|]*\|\s*(\d{1,2}:\d{2}(?:\.\d{2})?|\d{2}:\d{2}:\d{2}(?:\.\d{2})?)\s*\|'
         
         current_gender = 'male'  # Default assumption
         current_race_class = 'varsity'  # Default assumption
@@ -1810,31 +2087,34 @@ class MileSplitScraper:
             lines_checked += 1
                 
             # Check for gender and race class indicators in headers
-            line_lower = line.lower()
-            if any(word in line_lower for word in ['girls', 'female', 'women']):
+            if _GENDER_FEMALE_RE.search(line):
                 current_gender = 'female'
-            elif any(word in line_lower for word in ['boys', 'male', 'men']):
+            elif _GENDER_MALE_RE.search(line):
                 current_gender = 'male'
                 
-            if 'jv ' in line_lower or 'junior varsity' in line_lower:
+            if _JV_RE.search(line):
                 current_race_class = 'jv'
-            elif 'varsity' in line_lower:
+            elif _VARSITY_RE.search(line):
                 current_race_class = 'varsity'
-            elif 'freshman' in line_lower:
+            elif _FRESHMAN_RE.search(line):
                 current_race_class = 'freshman'
             
+            # A result row has at least 7 pipes; skip the regex for anything shorter
+            if line.count('|') < 7:
+                continue
+            
             # Look for result patterns
-            match = re.search(result_pattern, line)
+            match = _RESULT_PATTERN_RE.search(line)
             if match:
                 matches_found += 1
-                logger.info(f"Found match in line: {line}")
+                logger.debug("Found match in line: %s", line)
                 try:
                     place = int(match.group(1))
                     name_and_school = match.group(2).strip()
                     grade = int(match.group(3))
                     time_str = match.group(4).strip()
                     
-                    logger.info(f"  Parsed: place={place}, name_school='{name_and_school}', grade={grade}, time='{time_str}'")
+                    logger.debug("  Parsed: place=%s, name_school='%s', grade=%s, time='%s'", place, name_and_school, grade, time_str)
                     
                     # Parse the athlete name from the combined string
                     # Pattern is usually: "School Name First Last"
@@ -1843,14 +2123,12 @@ class MileSplitScraper:
                     # Split by spaces and find where athlete name likely starts
                     words = name_and_school.split()
                     
-                    # Common school indicators that help us identify where athlete name starts
-                    school_indicators = ['high', 'school', 'middle', 'academy', 'charter', 'classical']
-                    
-                    # Find the last occurrence of school indicators
+                    # Find the last occurrence of school indicators, scanning from the right
                     last_school_word_idx = -1
-                    for i, word in enumerate(words):
-                        if word.lower() in school_indicators:
+                    for i in range(len(words) - 1, -1, -1):
+                        if words[i].lower() in _SCHOOL_INDICATORS:
                             last_school_word_idx = i
+                            break
                     
                     # Extract athlete name (words after the school name)
                     if last_school_word_idx >= 0 and last_school_word_idx < len(words) - 2:
@@ -1863,15 +2141,15 @@ class MileSplitScraper:
                         first_name = words[-2]
                         last_name = words[-1]
                     else:
-                        logger.warning(f"Could not parse athlete name from: {name_and_school}")
+                        logger.warning("Could not parse athlete name from: %s", name_and_school)
                         continue
                     
-                    logger.info(f"  Athlete: {first_name} {last_name} from {school_name}")
+                    logger.debug("  Athlete: %s %s from %s", first_name, last_name, school_name)
                     
                     # Parse time
                     time_seconds = self.parse_time_to_seconds(time_str)
                     if not time_seconds:
-                        logger.warning(f"Could not parse time: {time_str}")
+                        logger.warning("Could not parse time: %s", time_str)
                         continue
                     
                     # Calculate varsity points (top 7 finishers typically score for varsity)
@@ -1894,10 +2172,10 @@ class MileSplitScraper:
                     )
                     
                     results.append(result)
-                    logger.debug(f"Parsed result: {first_name} {last_name}, {time_str} -> {time_seconds}s, place {place}")
+                    logger.debug("Parsed result: %s %s, %s -> %ss, place %s", first_name, last_name, time_str, time_seconds, place)
                     
                 except (ValueError, IndexError) as e:
-                    logger.warning(f"Error parsing line: {line[:100]}... - {e}")
+                    logger.warning("Error parsing line: %s... - %s", line[:100], e)
                     continue
         
         # Validate that the highest place number matches the total number of results
@@ -1907,11 +2185,11 @@ class MileSplitScraper:
                 max_place = max(places)
                 total_results = len(results)
                 if max_place != total_results:
-                    logger.warning(f"Place number validation failed: highest place is {max_place} but total results is {total_results}. Some results may be missing.")
+                    logger.warning("Place number validation failed: highest place is %s but total results is %s. Some results may be missing.", max_place, total_results)
                 else:
-                    logger.info(f"Place number validation passed: {max_place} places match {total_results} total results")
+                    logger.info("Place number validation passed: %s places match %s total results", max_place, total_results)
         
-        logger.info(f"Checked {lines_checked} lines, found {matches_found} potential matches, parsed {len(results)} results from text content")
+        logger.info("Checked %s lines, found %s potential matches, parsed %s results from text content", lines_checked, matches_found, len(results))
         return results
 
     def parse_table_row(self, cells) -> Optional[Result]:
@@ -1923,7 +2201,7 @@ class MileSplitScraper:
             time_text = cells[-2].get_text(strip=True)  # Time is usually second to last
             
             # Parse place
-            place_match = re.search(r'(\d+)', place_text)
+            place_match = _PLACE_RE.search(place_text)
             place = int(place_match.group(1)) if place_match else 0
             
             # Parse time
@@ -1968,100 +2246,114 @@ class MileSplitScraper:
 
     def determine_gender(self, soup: BeautifulSoup, name_text: str) -> str:
         """Determine gender from page content or default to 'male'."""
-        # Look for gender indicators in the page title or headers
-        title = soup.find('title')
-        headers = soup.find_all(['h1', 'h2', 'h3'])
-        
-        text_content = ' '.join([title.get_text() if title else ''] + 
-                               [h.get_text() for h in headers]).lower()
+        # Look for gender indicators in the page title or headers, collected in one walk of the tree
+        text_content = ' '.join(tag.get_text() for tag in soup.select('title, h1, h2, h3'))
         
-        if any(word in text_content for word in ['girls', 'female', 'women']):
+        if _GENDER_FEMALE_RE.search(text_content):
             return 'female'
-        elif any(word in text_content for word in ['boys', 'male', 'men']):
+        elif _GENDER_MALE_RE.search(text_content):
             return 'male'
         
         # Default fallback
         return 'male'
 
-    def get_or_create_venue(self, venue_name: str) -> str:
+    def get_or_create_venue(self, conn, venue_name: str) -> uuid.UUID:
         """Get existing venue or create new one, return venue_id."""
-        with self.engine.connect() as conn:
-            # Check if venue exists
-            result = conn.execute(
-                text("SELECT id FROM venues WHERE name = :name"),
-                {"name": venue_name}
-            ).fetchone()
-            
-            if result:
-                return str(result[0])
-            
-            # Create new venue
-            result = conn.execute(
-                text("INSERT INTO venues (name) VALUES (:name) RETURNING id"),
-                {"name": venue_name}
-            )
-            conn.commit()
-            return str(result.fetchone()[0])
+        if venue_name in self._venue_cache:
+            return self._venue_cache[venue_name]
+        
+        # Insert or fetch the venue in one round-trip; the no-op update makes
+        # RETURNING yield the id of an existing row too
+        result = conn.execute(VENUE_UPSERT_SQL, {"name": venue_name})
+        venue_id = result.fetchone()[0]
+        self._venue_cache[venue_name] = venue_id
+        return venue_id
+
+    def get_or_create_athletes(self, conn, athletes: List[Athlete]) -> Dict[Tuple[str, str, str, str], uuid.UUID]:
+        """Get or create all given athletes in one batch, return a map of athlete key to athlete_id."""
+        # Only athletes not seen earlier in this run need the database; collapse
+        # duplicates too (keeping the first graduation year seen)
+        unique_athletes = {}
+        for athlete in athletes:
+            if athlete.key not in self._athlete_cache:
+                unique_athletes.setdefault(athlete.key, athlete.graduation_year)
+        
+        if not unique_athletes:
+            return self._athlete_cache
+        
+        rows = [key + (graduation_year,) for key, graduation_year in unique_athletes.items()]
+        with conn.connection.cursor() as cursor:
+            # New athletes come back from the insert; existing ones are left untouched
+            # and looked up in one query, instead of rewriting their rows
+            returned = execute_values(cursor, ATHLETES_INSERT_SQL, rows, page_size=500, fetch=True)
+            for athlete_id, first_name, last_name, gender, school in returned:
+                self._athlete_cache[(first_name, last_name, gender, school)] = athlete_id
+            
+            existing_keys = [key for key in unique_athletes if key not in self._athlete_cache]
+            if existing_keys:
+                returned = execute_values(cursor, ATHLETES_SELECT_SQL, existing_keys, page_size=500, fetch=True)
+                for athlete_id, first_name, last_name, gender, school in returned:
+                    self._athlete_cache[(first_name, last_name, gender, school)] = athlete_id
+        return self._athlete_cache
+
+    def insert_results(self, conn, race_id: uuid.UUID, results: List[Result]) -> int:
+        """Insert results for a race, skipping ones already stored; return the number inserted."""
+        # Resolve every athlete in one batch, then insert all result rows in one
+        # statement; ON CONFLICT drops rows matching idx_results_identity
+        athlete_ids = self.get_or_create_athletes(conn, [result.athlete for result in results])
+        rows = [
+            (race_id, athlete_ids[result.athlete.key], result.time_seconds, result.place, result.varsity_points)
+            for result in results
+        ]
+        with conn.connection.cursor() as cursor:
+            inserted = execute_values(cursor, RESULTS_INSERT_SQL, rows, page_size=500, fetch=True)
+        return len(inserted)
 
-    def get_or_create_athlete(self, athlete: Athlete) -> str:
-        """Get existing athlete or create new one, return athlete_id."""
+    def missing_upsert_indexes(self) -> List[str]:
+        """Return the unique indexes the inserts need that the database doesn't have."""
         with self.engine.connect() as conn:
-            # Check if athlete exists
-            result = conn.execute(
-                text("""
-                    SELECT id FROM athletes 
-                    WHERE first_name = :first_name 
-                    AND last_name = :last_name 
-                    AND gender = :gender
-                    AND school = :school
-                """),
-                {
-                    "first_name": athlete.first_name,
-                    "last_name": athlete.last_name,
-                    "gender": athlete.gender,
-                    "school": athlete.school
-                }
-            ).fetchone()
-            
-            if result:
-                return str(result[0])
-            
-            # Create new athlete
-            result = conn.execute(
-                text("""
-                    INSERT INTO athletes (first_name, last_name, gender, school, graduation_year) 
-                    VALUES (:first_name, :last_name, :gender, :school, :graduation_year) 
-                    RETURNING id
-                """),
-                {
-                    "first_name": athlete.first_name,
-                    "last_name": athlete.last_name,
-                    "gender": athlete.gender,
-                    "school": athlete.school,
-                    "graduation_year": athlete.graduation_year
-                }
-            )
-            conn.commit()
-            athlete_id = str(result.fetchone()[0])
-            return athlete_id
+            present = set(conn.execute(UPSERT_INDEXES_SQL, {'index_names': list(UPSERT_INDEXES)}).scalars())
+        return [index_name for index_name in UPSERT_INDEXES if index_name not in present]
+
+    def filter_unseen_races(self, race_configs: List[RaceConfig]) -> List[RaceConfig]:
+        """Return only the race configs that don't already have a race in the database."""
+        meet_names = list({race_config.meet_name for race_config in race_configs})
+        if not meet_names:
+            return race_configs
+        
+        # One query for every stored race at these meets, matched on the same
+        # columns store_race_results uses to find an existing meet and race
+        with self.engine.connect() as conn:
+            rows = conn.execute(RACE_KEYS_SQL, {"meet_names": meet_names}).fetchall()
+        existing = {
+            (meet_name, str(meet_date), venue_name, race_name, distance, race_class, gender)
+            for meet_name, meet_date, venue_name, race_name, distance, race_class, gender in rows
+        }
+        
+        unseen = []
+        for race_config in race_configs:
+            key = (race_config.meet_name, str(race_config.date), race_config.venue, race_config.race_name,
+                   race_config.distance, race_config.race_class, self.map_gender_for_db(race_config.gender))
+            if key in existing:
+                logger.info("Skipping existing race: %s - %s", race_config.meet_name, race_config.race_name)
+            else:
+                unseen.append(race_config)
+        return unseen
 
     def store_race_results(self, race_config: RaceConfig, results: List[Result]):
         """Store race results in the database, avoiding duplicates."""
         if not results:
-            logger.warning(f"No results to store for race: {race_config.race_name}")
+            logger.warning("No results to store for race: %s", race_config.race_name)
             return
         
         try:
-            with self.engine.connect() as conn:
+            with self.engine.begin() as conn:
                 # Get or create venue
-                venue_id = self.get_or_create_venue(race_config.venue)
+                venue_id = self.get_or_create_venue(conn, race_config.venue)
                 
                 # Check if meet already exists, if not create it
                 meet_result = conn.execute(
-                    text("""
-                        SELECT id FROM meets 
-                        WHERE name = :name AND meet_date = :meet_date AND venue_id = :venue_id
-                    """),
+                    MEET_SELECT_SQL,
                     {
                         "name": race_config.meet_name,
                         "meet_date": race_config.date,
@@ -2070,15 +2362,11 @@ class MileSplitScraper:
                 ).fetchone()
                 
                 if meet_result:
-                    meet_id = str(meet_result[0])
+                    meet_id = meet_result[0]
                 else:
                     # Create new meet
                     meet_result = conn.execute(
-                        text("""
-                            INSERT INTO meets (name, meet_date, venue_id, season, milesplit_url)
-                            VALUES (:name, :meet_date, :venue_id, :season, :url)
-                            RETURNING id
-                        """),
+                        MEET_INSERT_SQL,
                         {
                             "name": race_config.meet_name,
                             "meet_date": race_config.date,
@@ -2087,15 +2375,11 @@ class MileSplitScraper:
                             "url": race_config.url
                         }
                     )
-                    meet_id = str(meet_result.fetchone()[0])
+                    meet_id = meet_result.fetchone()[0]
                 
                 # Check if race already exists
                 race_result = conn.execute(
-                    text("""
-                        SELECT id FROM races 
-                        WHERE meet_id = :meet_id AND name = :name AND distance = :distance 
-                        AND race_class = :race_class AND gender = :gender
-                    """),
+                    RACE_SELECT_SQL,
                     {
                         "meet_id": meet_id,
                         "name": race_config.race_name,
@@ -2106,85 +2390,25 @@ class MileSplitScraper:
                 ).fetchone()
                 
                 if race_result:
-                    race_id = str(race_result[0])
-                    logger.info(f"Race already exists: {race_config.race_name} - checking for new results")
-                    
-                    # Get existing results for this race to avoid duplicates
-                    existing_results = conn.execute(
-                        text("""
-                            SELECT a.first_name, a.last_name, a.school, res.time_seconds, res.place
-                            FROM results res
-                            JOIN athletes a ON res.athlete_id = a.id
-                            WHERE res.race_id = :race_id
-                        """),
-                        {"race_id": race_id}
-                    ).fetchall()
-                    
-                    # Create a set of existing results for quick lookup
-                    existing_set = set()
-                    for existing in existing_results:
-                        # Use normalized names and times for comparison
-                        first_name = existing.first_name.strip().lower()
-                        last_name = existing.last_name.strip().lower()
-                        school = existing.school.strip().lower()
-                        # Round time to 2 decimal places to handle minor variations
-                        time_seconds = round(float(existing.time_seconds), 2)
-                        place = existing.place
-                        key = (first_name, last_name, school, time_seconds, place)
-                        existing_set.add(key)
+                    race_id = race_result[0]
+                    logger.info("Race already exists: %s - checking for new results", race_config.race_name)
                     
-                    # Bulk process new results for better performance
-                    new_results = []
-                    skipped_results_count = 0
-                    
-                    for result in results:
-                        # Normalize result data for comparison
-                        first_name = result.athlete.first_name.strip().lower()
-                        last_name = result.athlete.last_name.strip().lower()
-                        school = result.athlete.school.strip().lower()
-                        time_seconds = round(result.time_seconds, 2)
-                        place = result.place
-                        result_key = (first_name, last_name, school, time_seconds, place)
-                        
-                        if result_key not in existing_set:
-                            athlete_id = self.get_or_create_athlete(result.athlete)
-                            new_results.append({
-                                "race_id": race_id,
-                                "athlete_id": athlete_id,
-                                "time_seconds": result.time_seconds,
-                                "place": result.place,
-                                "varsity_points": result.varsity_points
-                            })
-                        else:
-                            skipped_results_count += 1
-                    
-                    # Bulk insert new results
-                    if new_results:
-                        conn.execute(
-                            text("""
-                                INSERT INTO results (race_id, athlete_id, time_seconds, place, varsity_points)
-                                VALUES (:race_id, :athlete_id, :time_seconds, :place, :varsity_points)
-                            """),
-                            new_results
-                        )
-                    
-                    new_results_count = len(new_results)
+                    # Results already stored for this race are skipped by the unique
+                    # index on (race_id, athlete_id, place)
+                    new_results_count = self.insert_results(conn, race_id, results)
+                    skipped_results_count = len(results) - new_results_count
                     
                     if new_results_count > 0:
-                        logger.info(f"Added {new_results_count} new results for race: {race_config.race_name}")
+                        logger.info("Added %s new results for race: %s", new_results_count, race_config.race_name)
                     if skipped_results_count > 0:
-                        logger.info(f"Skipped {skipped_results_count} duplicate results for race: {race_config.race_name}")
+                        logger.info("Skipped %s duplicate results for race: %s", skipped_results_count, race_config.race_name)
                     if new_results_count == 0 and skipped_results_count == 0:
-                        logger.info(f"No new results to add for race: {race_config.race_name}")
+                        logger.info("No new results to add for race: %s", race_config.race_name)
                         
                 else:
                     # Create new race
                     race_result = conn.execute(
-                        text("""
-                            INSERT INTO races (meet_id, name, distance, race_class, gender)
-                            VALUES (:meet_id, :name, :distance, :race_class, :gender)
-                            RETURNING id
-                        """),
+                        RACE_INSERT_SQL,
                         {
                             "meet_id": meet_id,
                             "name": race_config.race_name,
@@ -2193,65 +2417,50 @@ class MileSplitScraper:
                             "gender": self.map_gender_for_db(race_config.gender)
                         }
                     )
-                    race_id = str(race_result.fetchone()[0])
+                    race_id = race_result.fetchone()[0]
                     
-                    # Store all results for new race
-                    for result in results:
-                        athlete_id = self.get_or_create_athlete(result.athlete)
-                        
-                        conn.execute(
-                            text("""
-                                INSERT INTO results (race_id, athlete_id, time_seconds, place, varsity_points)
-                                VALUES (:race_id, :athlete_id, :time_seconds, :place, :varsity_points)
-                            """),
-                            {
-                                "race_id": race_id,
-                                "athlete_id": athlete_id,
-                                "time_seconds": result.time_seconds,
-                                "place": result.place,
-                                "varsity_points": result.varsity_points
-                            }
-                        )
+                    # Store all results for new race; rows repeated within the page
+                    # are dropped by the unique index, so report what was inserted
+                    stored_results_count = self.insert_results(conn, race_id, results)
+                    skipped_results_count = len(results) - stored_results_count
                     
-                    logger.info(f"Created new race and stored {len(results)} results: {race_config.race_name}")
-                
-                conn.commit()
+                    logger.info("Created new race and stored %s results: %s", stored_results_count, race_config.race_name)
+                    if skipped_results_count > 0:
+                        logger.info("Skipped %s duplicate results for race: %s", skipped_results_count, race_config.race_name)
                 
         except Exception as e:
-            logger.error(f"Error storing race results: {e}")
+            logger.error("Error storing race results: %s", e)
+            # The transaction rolled back, so ids cached during it may not exist
+            self._venue_cache.clear()
+            self._athlete_cache.clear()
             raise
 
     def normalize_name(self, name: str) -> str:
         """Capitalize first letter, lower case the rest for each word in a name."""
-        return ' '.join([w.capitalize() for w in name.split()])
+        return _normalize_name(name)
 
     def normalize_school_name(self, school: str) -> str:
         """Normalize school names to standard formats."""
-        school = school.strip()
-        
-        # Map common school name variations to standardized names
-        school_mappings = {
-            'Fort Collins': 'Fort Collins High School',
-            'Fort Collins HS': 'Fort Collins High School',
-            'Fort Collins High Sc': 'Fort Collins High School',
-            'FCHS': 'Fort Collins High School',
-            'Fossil Ridge HS': 'Fossil Ridge High School',
-            'Fossil Ridge': 'Fossil Ridge High School',
-            'Rocky Mountain HS': 'Rocky Mountain High School',
-            'Rocky Mountain': 'Rocky Mountain High School',
-        }
-        
-        # Check exact matches first
-        if school in school_mappings:
-            return school_mappings[school]
-        
-        # Check for partial matches and common patterns
-        if school.endswith(' HS') and not school.endswith(' High School'):
-            # Convert "School Name HS" to "School Name High School"
-            base_name = school[:-3].strip()
-            return f"{base_name} High School"
-        
-        return school
+        return _normalize_school_name(school)
+
+# Scraper used for parsing inside each ProcessPoolExecutor worker
+_worker_scraper = None
+
+def _init_parse_worker():
+    """Create the per-process parser-only scraper used by _scrape_in_worker."""
+    global _worker_scraper
+    # Workers only parse; the main process does all the database work
+    _worker_scraper = MileSplitScraper(None)
+
+def _scrape_in_worker(race_config: RaceConfig, source: str, is_file: bool, response: Optional[requests.Response]) -> List[Result]:
+    """Scrape one race in a worker process, reusing the page prefetched by the main process."""
+    if response is not None:
+        _worker_scraper._page_cache[source] = response
+    try:
+        return _worker_scraper.scrape_race_results(source, is_file=is_file, algorithm=getattr(race_config, 'algorithm', 'default'), gender=getattr(race_config, 'gender', 'unknown'), race_config=race_config)
+    finally:
+        # The worker outlives this race; don't hold on to its page
+        _worker_scraper._page_cache.pop(source, None)
 
 def main():
     """Main function to run the scraper."""
@@ -2260,6 +2469,8 @@ def main():
                        help='Clear all existing data before scraping')
     parser.add_argument('--config', type=str, default='/app/config/races.yaml',
                        help='Path to races configuration file')
+    parser.add_argument('--skip-existing', action='store_true',
+                       help='Skip races already in the database instead of checking them for new results')
     
     args = parser.parse_args()
     
@@ -2268,13 +2479,16 @@ def main():
         logger.error("DATABASE_URL environment variable not set")
         sys.exit(1)
     
-    config_path = args.config
-    if not os.path.exists(config_path):
-        # Fallback to environment variable if file not found
-        config_path = os.getenv('CONFIG_PATH', '/app/config/races.yaml')
-        if not os.path.exists(config_path):
-            logger.error(f"Config file not found: {config_path}")
-            sys.exit(1)
+    # Use the --config file, falling back to the CONFIG_PATH environment variable if it isn't there
+    for config_path in (args.config, os.getenv('CONFIG_PATH', '/app/config/races.yaml')):
+        try:
+            os.stat(config_path)
+            break
+        except OSError:
+            continue
+    else:
+        logger.error("Config file not found: %s", config_path)
+        sys.exit(1)
     
     scraper = MileSplitScraper(database_url)
     race_configs = scraper.load_race_config(config_path)
@@ -2283,46 +2497,77 @@ def main():
         logger.error("No race configurations found")
         sys.exit(1)
     
-    logger.info(f"Found {len(race_configs)} races to scrape")
+    logger.info("Found %s races to scrape", len(race_configs))
+    
+    # Every store relies on INSERT ... ON CONFLICT, which fails on each race
+    # without these indexes, so stop before fetching or parsing anything
+    missing_indexes = scraper.missing_upsert_indexes()
+    if missing_indexes:
+        logger.error("Database is missing unique indexes %s; run database/add_upsert_indexes.sql "
+                     "(see 'Upgrading an Existing Database' in DEPLOYMENT.md)", ', '.join(missing_indexes))
+        sys.exit(1)
     
     # Clear database if requested
     if args.clear_db:
         logger.info("Clearing existing data before scraping...")
         scraper.clear_database()
+    elif args.skip_existing:
+        # Leave out races already stored before any page is fetched or parsed
+        race_configs = scraper.filter_unseen_races(race_configs)
+        logger.info("%s races not yet in the database", len(race_configs))
+    
+    # Download every URL-based page up front instead of one at a time inside the loop
+    scraper.prefetch_pages([race_config.url for race_config in race_configs if race_config.url and not race_config.file])
     
-    # Process each race, checking for duplicates
+    # Determine source and type for each race
+    scraper_dir = os.path.dirname(__file__)
+    config_dir = os.path.dirname(config_path)
+    jobs = []
     for race_config in race_configs:
-        logger.info(f"Processing race: {race_config.meet_name} - {race_config.race_name}")
-        try:
-            # Determine source and type
-            if race_config.file:
-                # Use local file - look in the scraper directory
-                if race_config.file.startswith('pages/'):
-                    # File path is relative to scraper directory
-                    file_path = os.path.join(os.path.dirname(__file__), race_config.file)
-                else:
-                    # File path is relative to config file
-                    file_path = os.path.join(os.path.dirname(config_path), race_config.file)
-                results = scraper.scrape_race_results(file_path, is_file=True, algorithm=getattr(race_config, 'algorithm', 'default'), gender=getattr(race_config, 'gender', 'unknown'), race_config=race_config)
-            elif race_config.url:
-                # Use URL
-                results = scraper.scrape_race_results(race_config.url, is_file=False, algorithm=getattr(race_config, 'algorithm', 'default'), gender=getattr(race_config, 'gender', 'unknown'), race_config=race_config)
-            else:
-                logger.error(f"No source (URL or file) specified for race: {race_config.race_name}")
-                continue
-                
-            if results:
-                scraper.store_race_results(race_config, results)
-            else:
-                logger.warning(f"No results found for race: {race_config.race_name}")
-                
-        except Exception as e:
-            logger.error(f"Error processing race {race_config.race_name}: {e}")
-            continue
+        if race_config.file:
+            # Use local file: 'pages/...' is relative to the scraper directory,
+            # anything else to the config file
+            base_dir = scraper_dir if race_config.file.startswith('pages/') else config_dir
+            jobs.append((race_config, os.path.join(base_dir, race_config.file), True))
+        elif race_config.url:
+            # Use URL
+            jobs.append((race_config, race_config.url, False))
+        else:
+            logger.error("No source (URL or file) specified for race: %s", race_config.race_name)
+    
+    # After --clear-db every result is new, so load without the secondary indexes
+    # and build them once at the end
+    bulk_load = scraper.bulk_load_context() if args.clear_db else contextlib.nullcontext()
+    
+    with bulk_load:
+        # Parse pages in parallel worker processes while this process stores the
+        # results of each race in order, checking for duplicates
+        # Each worker builds its own scraper, so start no more of them than there are races
+        parse_workers = max(1, min(os.cpu_count() or 1, len(jobs)))
+        # Close the pooled connections before forking so no worker inherits them
+        scraper.engine.dispose()
+        # Several races can share a page; hand it off and drop it with its last race
+        last_job_for_source = {source: index for index, (_, source, _) in enumerate(jobs)}
+        with ProcessPoolExecutor(max_workers=parse_workers, initializer=_init_parse_worker) as executor:
+            futures = [
+                executor.submit(_scrape_in_worker, race_config, source, is_file,
+                                None if is_file else scraper.take_prefetched_page(source, last_use=last_job_for_source[source] == index))
+                for index, (race_config, source, is_file) in enumerate(jobs)
+            ]
         
-        # Only sleep for URL-based requests to be respectful to servers
-        if race_config.url and not race_config.file:
-            time.sleep(2)
+            for (race_config, source, is_file), future in zip(jobs, futures):
+                logger.info("Processing race: %s - %s", race_config.meet_name, race_config.race_name)
+                try:
+                    results = future.result()
+                
+                    if results:
+                        scraper.store_race_results(race_config, results)
+                    else:
+                        logger.warning("No results found for race: %s", race_config.race_name)
+                    
+                except Exception as e:
+                    logger.error("Error processing race %s: %s", race_config.race_name, e)
+                    continue
     
     logger.info("Scraping completed")
 